@@ -388,7 +388,7 @@ class PokemonBlueOrchestrator:
 
         def on_input_callback(button, duration):
             """Called when input is processed."""
-            self.logger.debug(f"Input: {button} for {duration}s")
+            self.logger.debug("Input: %s for %ss", button, duration)
 
         def on_error_callback(error_message):
             """Called when errors occur."""
@@ -535,7 +535,7 @@ class PokemonBlueOrchestrator:
             # Update performance stats
             if self.emulator:
                 game_state = self.emulator.get_game_state()
-                self.logger.debug(f"Game state: {game_state}")
+                self.logger.debug("Game state: %s", game_state)
 
             # Log system status every 10 seconds
             if self.emulator and hasattr(self.emulator, 'frame_count') and self.emulator.frame_count % 600 == 0:
@@ -461,6 +461,17 @@ TYPE_NAMES = {
 }
 
 
+# Convenience functions for the navigation tools
+def get_player_coordinates(memory):
+    """Convenience function to get the player's X and Y coordinates."""
+    return PokemonMemoryMap().get_player_coordinates(memory)
+
+
+def get_block_coordinates(memory):
+    """Convenience function to get the block X and Y coordinates."""
+    return PokemonMemoryMap().get_block_coordinates(memory)
+
+
 # Convenience functions for battle_helper.py
 def get_battle_pokemon_data(memory, is_player=True):
     """Convenience function to get battle Pokemon data."""
@@ -7,13 +7,17 @@ import unittest
 import sys
 import os
 
+import numpy as np
+
 # Add the project root to the Python path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from tools.battle_helper import (
     BattleHelper, Pokemon, Move, PokemonType, TypeEffectiveness,
-    get_type_effectiveness, calculate_damage, suggest_move,
-    TypeEffectivenessMatrix, PyBoyBattleIntegration
+    get_type_effectiveness, calculate_damage, suggest_move, damage_formula,
+    TypeEffectivenessMatrix, PyBoyBattleIntegration, pokemon_from_dict,
+    get_player_party_info, get_player_party_array, get_player_items,
+    PARTY_DTYPE, PARTY_DATA_START
 )
 
 
@@ -23,6 +27,10 @@ class TestTypeEffectivenessMatrix(unittest.TestCase):
     def setUp(self):
         self.matrix = TypeEffectivenessMatrix()
 
+    def test_type_indices_follow_declaration_order(self):
+        """Test that the table indices are dense and in member order."""
+        self.assertEqual([t.idx for t in PokemonType], list(range(15)))
+
     def test_water_super_effective_against_fire(self):
         """Test that Water is super effective against Fire."""
         effectiveness = self.matrix.get_effectiveness(PokemonType.WATER, PokemonType.FIRE)
@@ -57,6 +65,26 @@ class TestTypeEffectivenessMatrix(unittest.TestCase):
         )
         self.assertEqual(effectiveness, 1.0)  # Neutral
 
+    def test_index_lookup_matches_enum_lookup(self):
+        """Test that index-based lookups agree with the enum-keyed matrix."""
+        for att_type in PokemonType:
+            for def_type in PokemonType:
+                self.assertEqual(
+                    self.matrix.get_effectiveness_index(att_type.idx, (def_type.idx, def_type.idx)),
+                    float(self.matrix.get_effectiveness(att_type, def_type).value)
+                )
+
+    def test_index_lookup_dual_type(self):
+        """Test that dual-type index lookups multiply both matchups."""
+        water_ground = Pokemon("Quagsire", 20, [PokemonType.WATER, PokemonType.GROUND],
+                               80, 50, 50, 50, 50, [])
+        self.assertEqual(
+            self.matrix.get_effectiveness_index(PokemonType.GRASS.idx, water_ground.type_idxs), 4.0
+        )
+        self.assertEqual(
+            self.matrix.get_effectiveness_index(PokemonType.ELECTRIC.idx, water_ground.type_idxs), 0.0
+        )
+
 
 class TestPokemonAndMoves(unittest.TestCase):
     """Test Pokemon and Move classes."""
@@ -100,6 +128,30 @@ class TestPokemonAndMoves(unittest.TestCase):
         self.assertFalse(move.has_pp())
         self.assertEqual(move.pp, 0)
 
+    def test_use_pp_refreshes_available_moves(self):
+        """Test that spending the last PP removes a move from the available list."""
+        splash = Move("Splash", PokemonType.WATER, "Status", 0, 1)
+        tackle = Move("Tackle", PokemonType.NORMAL, "Physical", 35, 35)
+        pokemon = Pokemon("Magikarp", 5, [PokemonType.WATER], 20, 10, 55, 20, 80, [splash, tackle])
+
+        self.assertEqual(pokemon.get_available_moves(), [splash, tackle])
+
+        pokemon.use_pp(splash)
+
+        self.assertEqual(splash.pp, 0)
+        self.assertEqual(pokemon.get_available_moves(), [tackle])
+
+    def test_use_pp_keeps_cache_while_pp_remains(self):
+        """Test that spending PP without exhausting a move reuses the cached list."""
+        tackle = Move("Tackle", PokemonType.NORMAL, "Physical", 35, 35)
+        pokemon = Pokemon("Rattata", 5, [PokemonType.NORMAL], 20, 56, 35, 25, 72, [tackle])
+        available = pokemon.get_available_moves()
+
+        pokemon.use_pp(tackle)
+
+        self.assertEqual(tackle.pp, 34)
+        self.assertIs(pokemon.get_available_moves(), available)
+
 
 class TestDamageCalculation(unittest.TestCase):
     """Test damage calculation logic."""
@@ -152,6 +204,25 @@ class TestDamageCalculation(unittest.TestCase):
         self.assertGreater(damage, 0)
         self.assertLess(damage, 50)  # Should be reduced from normal damage
 
+    def test_expected_damage_batch(self):
+        """Test batched expected damage across moves of different categories."""
+        moves = [
+            Move("Water Gun", PokemonType.WATER, "Special", 40, 25),
+            Move("Tackle", PokemonType.NORMAL, "Physical", 35, 35),
+            Move("Tail Whip", PokemonType.NORMAL, "Status", 0, 30),
+            Move("Bubble", PokemonType.WATER, "Special", 20, 0)
+        ]
+
+        damage = self.battle_helper.expected_damage(self.squirtle, self.charmander, moves)
+
+        self.assertEqual(len(damage), 4)
+        # Super effective STAB Water Gun: ((2*10/5+2)*40*50/50/50 + 2) * 1.5 * 2
+        self.assertAlmostEqual(damage[0], 6.8 * 1.5 * 2 * 0.925 * 1.0625)
+        self.assertGreater(damage[0], damage[1])
+        # Status moves and moves without PP deal no damage
+        self.assertEqual(damage[2], 0.0)
+        self.assertEqual(damage[3], 0.0)
+
     def test_water_damage_against_fire(self):
         """Test Water damage against Fire (should be super effective)."""
         water_gun_move = Move("Water Gun", PokemonType.WATER, "Special", 40, 25)
@@ -161,6 +232,70 @@ class TestDamageCalculation(unittest.TestCase):
         # Water should be super effective against Fire
         self.assertGreater(damage, 30)  # Should do significant damage
 
+    def test_damage_batch_matches_roll_range(self):
+        """Test batched damage rolls against the scalar formula's bounds."""
+        moves = [
+            Move("Ember", PokemonType.FIRE, "Special", 40, 25),
+            Move("Scratch", PokemonType.NORMAL, "Physical", 40, 35),
+            Move("Growl", PokemonType.NORMAL, "Status", 0, 40),
+            Move("Flamethrower", PokemonType.FIRE, "Special", 95, 0),
+        ]
+
+        damage = BattleHelper(seed=3).calculate_damage_batch(self.charmander, self.squirtle, moves)
+
+        self.assertEqual(damage.dtype, np.int32)
+        self.assertEqual(len(damage), 4)
+        # Ember is resisted by Water but gets STAB; the roll spans 85% up to a critical hit
+        level_factor = (2 * self.charmander.level / 5) + 2
+        ember_base = (level_factor * 40 * self.charmander.special / self.squirtle.special) / 50 + 2
+        low = int(ember_base * 1.5 * 0.5 * 0.85)
+        high = int(ember_base * 1.5 * 0.5 * 2)
+        self.assertTrue(max(low, 1) <= damage[0] <= high)
+        self.assertGreater(damage[1], 0)
+        self.assertEqual(damage[2], 0)  # Status move
+        self.assertEqual(damage[3], 0)  # No PP left
+
+    def test_damage_formula_broadcasts_matchups(self):
+        """Test the array damage formula over a moves x defenders table."""
+        powers = np.array([[40], [80]])
+        defenses = np.array([100, 50])
+        effectiveness = np.array([2.0, 0.0])
+
+        damage = damage_formula(50, powers, 100, defenses, effectiveness, 1.5)
+
+        self.assertEqual(damage.dtype, np.int32)
+        np.testing.assert_array_equal(damage, [[58, 0], [111, 0]])
+        # Resisted chip damage still does at least 1
+        self.assertEqual(damage_formula(2, 1, 1, 255, 0.25, 1.0), 1)
+
+    def test_seeded_damage_is_reproducible(self):
+        """Test that helpers built with the same seed roll the same damage."""
+        ember = Move("Ember", PokemonType.FIRE, "Special", 40, 25)
+        rolls = []
+        for _ in range(2):
+            helper = BattleHelper(seed=7)
+            rolls.append([helper.calculate_damage(self.charmander, self.squirtle, ember) for _ in range(5)])
+
+        self.assertEqual(rolls[0], rolls[1])
+
+    def test_scalar_and_batch_damage_agree(self):
+        """Test that single and batched damage rolls match for the same seed, even against 0 defense."""
+        moves = [
+            Move("Ember", PokemonType.FIRE, "Special", 40, 25),
+            Move("Scratch", PokemonType.NORMAL, "Physical", 40, 35),
+        ]
+        wall = Pokemon("Glass", 10, [PokemonType.NORMAL], 30, 10, 0, 0, 10, [])
+
+        for defender in (self.squirtle, wall):
+            for seed in range(5):
+                scalar_helper = BattleHelper(seed=seed)
+                batch_helper = BattleHelper(seed=seed)
+                for move in moves:
+                    self.assertEqual(
+                        scalar_helper.calculate_damage(self.charmander, defender, move),
+                        batch_helper.calculate_damage_batch(self.charmander, defender, [move])[0]
+                    )
+
 
 class TestMoveSelection(unittest.TestCase):
     """Test move selection logic."""
@@ -204,6 +339,25 @@ class TestMoveSelection(unittest.TestCase):
         # Should suggest a move
         self.assertIsNotNone(suggestion["move"])
 
+    def test_move_suggestion_without_details(self):
+        """Test that damage and effectiveness are skipped when not requested."""
+        full = self.battle_helper.suggest_move(self.charizard, self.blastoise)
+        brief = self.battle_helper.suggest_move(
+            self.charizard, self.blastoise, include_details=False)
+
+        self.assertIs(brief["move"], full["move"])
+        self.assertEqual(brief["reason"], full["reason"])
+        self.assertNotIn("damage", brief)
+        self.assertNotIn("effectiveness", brief)
+
+    def test_move_suggestion_without_reason(self):
+        """Test that only the move is returned when neither reason nor details are requested."""
+        full = self.battle_helper.suggest_move(self.charizard, self.blastoise)
+        bare = self.battle_helper.suggest_move(
+            self.charizard, self.blastoise, include_details=False, return_reason=False)
+
+        self.assertEqual(bare, {"move": full["move"]})
+
     def test_super_effective_move_preference(self):
         """Test that super effective moves are preferred."""
         # Electric move should be super effective against Water/Flying
@@ -268,6 +422,45 @@ class TestStrategicDecisions(unittest.TestCase):
         self.assertIn("recommended_pokemon", switch_decision)
         self.assertIn("reason", switch_decision)
 
+    def test_no_switch_against_neutral_attacker(self):
+        """Test that a healthy Pokemon facing only neutral attacks stays in."""
+        raichu_moves = [Move("Thunderbolt", PokemonType.ELECTRIC, "Special", 95, 15)]
+        raichu = Pokemon("Raichu", 30, [PokemonType.ELECTRIC], 100, 90, 55, 80, 100, raichu_moves)
+
+        switch_decision = self.battle_helper.should_switch_pokemon(
+            self.battle_helper.battle_state.player_pokemon,
+            self.battle_helper.battle_state.opponent_pokemon,
+            [raichu]
+        )
+
+        self.assertFalse(switch_decision["should_switch"])
+        self.assertIsNone(switch_decision["recommended_pokemon"])
+
+    def test_switch_to_best_resisting_member(self):
+        """Test that a threatened Pokemon switches to the party member with the best matchup."""
+        # Water attacker threatening a Fire type
+        starmie = Pokemon("Starmie", 30, [PokemonType.WATER, PokemonType.PSYCHIC], 90, 75, 85, 100, 115,
+                          [Move("Surf", PokemonType.WATER, "Special", 95, 15)])
+        charmander = Pokemon("Charmander", 30, [PokemonType.FIRE], 90, 52, 43, 50, 65,
+                             [Move("Ember", PokemonType.FIRE, "Special", 40, 25)])
+        # Best matchup on paper, but fainted
+        exeggutor = Pokemon("Exeggutor", 30, [PokemonType.GRASS, PokemonType.PSYCHIC], 0, 95, 85, 125, 55,
+                            [Move("Solar Beam", PokemonType.GRASS, "Special", 120, 10),
+                             Move("Mega Drain", PokemonType.GRASS, "Special", 120, 10)])
+        pidgey = Pokemon("Pidgey", 30, [PokemonType.NORMAL, PokemonType.FLYING], 60, 45, 40, 35, 56,
+                         [Move("Gust", PokemonType.NORMAL, "Special", 40, 35)])
+        bulbasaur = Pokemon("Bulbasaur", 30, [PokemonType.GRASS, PokemonType.POISON], 80, 49, 49, 65, 45,
+                            [Move("Solar Beam", PokemonType.GRASS, "Special", 120, 10),
+                             Move("Razor Leaf", PokemonType.GRASS, "Physical", 55, 25),
+                             Move("Vine Whip", PokemonType.GRASS, "Physical", 35, 10)])
+
+        switch_decision = self.battle_helper.should_switch_pokemon(
+            charmander, starmie, [charmander, exeggutor, pidgey, bulbasaur]
+        )
+
+        self.assertTrue(switch_decision["should_switch"])
+        self.assertIs(switch_decision["recommended_pokemon"], bulbasaur)
+
     def test_item_usage_recommendation(self):
         """Test item usage recommendations."""
         # Create injured Pokemon
@@ -345,6 +538,33 @@ class TestConvenienceFunctions(unittest.TestCase):
         damage = calculate_damage(attacker, defender, move)
         self.assertGreater(damage, 0)
 
+    def test_pokemon_from_dict(self):
+        """Test dict conversion skips malformed moves and defaults unknown types."""
+        pokemon = pokemon_from_dict({
+            'species': 'Missingno', 'level': 5, 'types': ['Bird'],
+            'hp': 33, 'attack': 136, 'defense': 0, 'special': 6, 'speed': 29,
+            'moves': [
+                {'name': 'Water Gun', 'type': 'Water', 'category': 'Special', 'power': 40, 'pp': 25},
+                {'name': 'Sky Attack', 'type': 'Bird', 'category': 'Physical', 'power': 140, 'pp': 5},
+                {'name': 'Incomplete', 'type': 'Normal'}
+            ]
+        })
+
+        self.assertEqual(pokemon.types, [PokemonType.NORMAL])
+        self.assertEqual([m.name for m in pokemon.moves], ['Water Gun'])
+        self.assertEqual(pokemon.moves[0].type, PokemonType.WATER)
+
+    def test_pokemon_from_dict_without_moves(self):
+        """Test that stats-only conversion leaves the move list empty."""
+        pokemon = pokemon_from_dict({
+            'species': 'Onix', 'level': 14, 'types': ['Rock', 'Ground'],
+            'hp': 45, 'attack': 45, 'defense': 160, 'special': 30, 'speed': 70,
+            'moves': [{'name': 'Tackle', 'type': 'Normal', 'category': 'Physical', 'power': 35, 'pp': 35}]
+        }, with_moves=False)
+
+        self.assertEqual(pokemon.moves, [])
+        self.assertEqual(pokemon.types, [PokemonType.ROCK, PokemonType.GROUND])
+
     def test_suggest_move_convenience(self):
         """Test suggest_move convenience function."""
         attacker = {
@@ -413,6 +633,393 @@ class TestPyBoyIntegration(unittest.TestCase):
 
         self.assertTrue(integration.is_in_battle())
 
+    def test_party_info_from_memory(self):
+        """Test unpacking the Gen 1 party structure from RAM."""
+        memory = bytearray(0x10000)
+        memory[0xD163] = 2  # Party count
+        records = np.zeros(2, dtype=PARTY_DTYPE)
+        records[0] = (0x99, 39, 12, 0, (0x15, 0x15), 45, (33, 55, 0, 0), 0, 0, 0, 0,
+                      (35, 0xC0 | 25, 0, 0), 12, 41, 24, 30, 22, 26)
+        records[1] = (0xB0, 20, 9, 0, (0x14, 0x02), 45, (10, 0, 0, 0), 0, 0, 0, 0,
+                      (35, 0, 0, 0), 9, 30, 20, 18, 25, 19)
+        memory[PARTY_DATA_START:PARTY_DATA_START + records.nbytes] = records.tobytes()
+
+        party = get_player_party_info(memory)
+
+        self.assertEqual(len(party), 2)
+        self.assertEqual(party[0]['species'], 0x99)
+        self.assertEqual(party[0]['level'], 12)
+        self.assertEqual((party[0]['hp'], party[0]['max_hp']), (39, 41))
+        self.assertEqual(party[0]['types'], [0x15])
+        self.assertEqual([m['pp'] for m in party[0]['moves']], [35, 25])
+        self.assertEqual(party[1]['types'], [0x14, 0x02])
+        self.assertEqual(party[1]['special'], 19)
+
+        # The same data as columns over the whole party
+        arrays = get_player_party_array(memory)
+        self.assertEqual(arrays['hp'].tolist(), [39, 20])
+        self.assertEqual(arrays['types'][1].tolist(), [0x14, 0x02])
+
+    def test_items_from_memory(self):
+        """Test reading the bag and skipping empty slots."""
+        memory = bytearray(0x10000)
+        memory[0xD31C] = 3  # Bag count
+        memory[0xD31D:0xD31D + 8] = bytes([0x14, 2, 0x00, 5, 0x04, 10, 0x0B, 1])
+
+        items = get_player_items(memory)
+
+        # The fourth slot lies beyond the bag count
+        self.assertEqual(items, [{'id': 0x14, 'quantity': 2}, {'id': 0x04, 'quantity': 10}])
+        self.assertEqual(get_player_items(None), [])
+
+    def test_memory_resolved_once(self):
+        """Test that the PyBoy memory accessor is probed once, not on every access."""
+        class MockPyBoy:
+            probes = 0
+
+            def get_memory(self):
+                MockPyBoy.probes += 1
+                return bytearray(0x10000)
+
+        integration = PyBoyBattleIntegration(MockPyBoy())
+        memory = integration.get_memory()
+
+        self.assertIs(integration.get_memory(), memory)
+        self.assertFalse(integration.is_in_battle())
+        self.assertEqual(MockPyBoy.probes, 1)
+
+    def test_battle_state_outside_battle(self):
+        """Test that polls outside battle short-circuit before reading battle data."""
+        class MockPyBoy:
+            def get_memory(self):
+                return bytearray(0x10000)
+
+        integration = PyBoyBattleIntegration(MockPyBoy())
+
+        state = integration.get_current_battle_state()
+        self.assertFalse(state["in_battle"])
+        self.assertIn("error", state)
+        self.assertIn("error", integration.get_battle_decision_from_memory())
+        self.assertIsNone(integration._last_result)
+
+    def test_battle_state_reused_while_memory_unchanged(self):
+        """Test that repeated reads of unchanged RAM return the cached state."""
+        memory = bytearray(0x10000)
+        memory[0xD057] = 0x01  # In battle flag
+
+        class MockPyBoy:
+            def get_memory(self):
+                return memory
+
+        integration = PyBoyBattleIntegration(MockPyBoy())
+
+        first = integration.get_current_battle_state()
+        self.assertTrue(first["in_battle"])
+        self.assertIs(integration.get_current_battle_state(), first)
+
+        memory[0xCFF8] = 30  # Enemy HP changed
+        changed = integration.get_current_battle_state()
+        self.assertIsNot(changed, first)
+        self.assertEqual(changed["enemy_pokemon"]["hp"], 30)
+
+    def test_battle_state_refreshed_on_in_turn_changes(self):
+        """Test that status, bench HP and item quantity changes within a turn are not served stale."""
+        memory = bytearray(0x10000)
+        memory[0xD057] = 0x01  # In battle flag
+        memory[0xD163] = 2  # Party count
+        memory[0xD31C] = 1  # Bag count
+        memory[0xD31D:0xD31F] = bytes([0x14, 3])
+
+        class MockPyBoy:
+            def get_memory(self):
+                return memory
+
+        integration = PyBoyBattleIntegration(MockPyBoy())
+        first = integration.get_current_battle_state_raw()
+
+        memory[0xCF95 + 10] = 0x04  # Player Pokemon burned
+        status_changed = integration.get_current_battle_state_raw()
+        self.assertIsNot(status_changed, first)
+        self.assertEqual(status_changed["player_pokemon"]["status"], 0x04)
+
+        memory[0xD16B + 44 + 2] = 9  # Benched party member's HP
+        self.assertIsNot(integration.get_current_battle_state_raw(), status_changed)
+
+        memory[0xD31E] = 2  # One item used from the stack
+        self.assertEqual(integration.get_current_battle_state_raw()["items"],
+                         [{'id': 0x14, 'quantity': 2}])
+
+    def test_party_pp_change_reaches_battle_state(self):
+        """Test that a PP-only change to a party move updates the converted party."""
+        memory = bytearray(0x10000)
+        memory[0xD057] = 0x01  # In battle flag
+        memory[0xD163] = 1  # Party count
+        memory[0xD16B] = 25  # Species
+        memory[0xD16B + 2] = 30  # HP
+        memory[0xD16B + 8] = 0x21  # First move
+        memory[0xD16B + 29] = 1  # Its PP
+
+        class MockPyBoy:
+            def get_memory(self):
+                return memory
+
+        integration = PyBoyBattleIntegration(MockPyBoy())
+        battle_state = integration.battle_helper.battle_state
+        integration.get_current_battle_state()
+        self.assertEqual(battle_state.party_pokemon[0].moves[0].pp, 1)
+
+        memory[0xD16B + 29] = 0  # Last PP spent, HP unchanged
+        integration.get_current_battle_state()
+        self.assertEqual(battle_state.party_pokemon[0].moves[0].pp, 0)
+        self.assertEqual(battle_state.party_pokemon[0].get_available_moves(), [])
+
+    def test_status_change_reaches_battle_state(self):
+        """Test that a status-only change to the active Pokemon updates the converted Pokemon."""
+        memory = bytearray(0x10000)
+        memory[0xD057] = 0x01  # In battle flag
+        memory[0xCF95 + 7] = 30  # Player Pokemon HP
+
+        class MockPyBoy:
+            def get_memory(self):
+                return memory
+
+        integration = PyBoyBattleIntegration(MockPyBoy())
+        battle_state = integration.battle_helper.battle_state
+        integration.get_current_battle_state()
+        self.assertIsNone(battle_state.player_pokemon.status_condition)
+
+        memory[0xCF95 + 10] = 0x10  # Paralysed, HP unchanged
+        integration.get_current_battle_state()
+        self.assertEqual(battle_state.player_pokemon.status_condition, "Paralysis")
+        self.assertEqual(battle_state.player_pokemon.hp, 30)
+
+    def test_raw_battle_state_skips_pokemon_conversion(self):
+        """Test that the raw read leaves the battle helper untouched."""
+        memory = bytearray(0x10000)
+        memory[0xD057] = 0x01  # In battle flag
+
+        class MockPyBoy:
+            def get_memory(self):
+                return memory
+
+        integration = PyBoyBattleIntegration(MockPyBoy())
+
+        raw = integration.get_current_battle_state_raw()
+        self.assertTrue(raw["in_battle"])
+        self.assertIsNone(integration.battle_helper.battle_state.player_pokemon)
+
+        self.assertIs(integration.get_current_battle_state(), raw)
+        self.assertIsNotNone(integration.battle_helper.battle_state.player_pokemon)
+
+    def test_raw_battle_state_reads_one_window(self):
+        """Test that a changed battle state is decoded from a single memory slice."""
+        class CountingMemory:
+            def __init__(self, data):
+                self.data = data
+                self.slices = 0
+
+            def __getitem__(self, key):
+                if isinstance(key, slice):
+                    self.slices += 1
+                return self.data[key]
+
+        data = bytearray(0x10000)
+        data[0xD057] = 0x01  # In battle flag
+        data[0xCF95] = 25  # Player species
+        data[0xCF97] = 12  # Player level
+        data[0xCFF1] = 74  # Enemy species
+        data[0xD163] = 1  # Party count
+        data[0xD31C] = 1  # Bag count
+        data[0xD31D:0xD31F] = bytes([0x14, 3])
+        memory = CountingMemory(data)
+
+        class MockPyBoy:
+            def get_memory(self):
+                return memory
+
+        raw = PyBoyBattleIntegration(MockPyBoy()).get_current_battle_state_raw()
+
+        self.assertEqual(memory.slices, 1)
+        self.assertEqual((raw["player_pokemon"]["species"], raw["player_pokemon"]["level"]), (25, 12))
+        self.assertEqual(raw["enemy_pokemon"]["species"], 74)
+        self.assertEqual(len(raw["party_pokemon"]), 1)
+        self.assertEqual(raw["items"], [{'id': 0x14, 'quantity': 3}])
+
+    def test_raw_battle_state_reuses_snapshot_buffer(self):
+        """Test that successive reads refill one snapshot buffer in place."""
+        memory = bytearray(0x10000)
+        memory[0xD057] = 0x01  # In battle flag
+        memory[0xCF95] = 25  # Player species
+
+        class MockPyBoy:
+            def get_memory(self):
+                return memory
+
+        integration = PyBoyBattleIntegration(MockPyBoy())
+        buffer = integration._snapshot
+        first = integration.get_current_battle_state_raw()
+        memory[0xCF95] = 26
+        second = integration.get_current_battle_state_raw()
+
+        self.assertIs(integration._snapshot, buffer)
+        self.assertEqual(first["player_pokemon"]["species"], 25)
+        self.assertEqual(second["player_pokemon"]["species"], 26)
+
+    def test_execute_move_input_sequence(self):
+        """Test that a move is executed as one scheduled A hold and one tick call."""
+        class RecordingPyBoy:
+            def __init__(self):
+                self.calls = []
+
+            def button(self, button, delay=1):
+                self.calls.append(("button", button, delay))
+
+            def tick(self, frames):
+                self.calls.append(("tick", frames))
+
+        pyboy = RecordingPyBoy()
+        integration = PyBoyBattleIntegration(pyboy)
+        move = Move("Tackle", PokemonType.NORMAL, "Physical", 35, 35)
+
+        self.assertTrue(integration._execute_move(move))
+        self.assertEqual(pyboy.calls, [("button", "a", 40), ("tick", 120)])
+
+    def test_execute_move_without_scheduled_input(self):
+        """Test that a PyBoy without button() gets the manual press, tick and release."""
+        class RecordingPyBoy:
+            def __init__(self):
+                self.calls = []
+
+            def button_press(self, button):
+                self.calls.append(("press", button))
+
+            def button_release(self, button):
+                self.calls.append(("release", button))
+
+            def tick(self, frames):
+                self.calls.append(("tick", frames))
+
+        pyboy = RecordingPyBoy()
+        integration = PyBoyBattleIntegration(pyboy)
+        move = Move("Tackle", PokemonType.NORMAL, "Physical", 35, 35)
+
+        self.assertTrue(integration._execute_move(move))
+        self.assertEqual(pyboy.calls, [("press", "a"), ("tick", 40), ("release", "a"), ("tick", 80)])
+
+    def test_execute_battle_decision_dispatch(self):
+        """Test that decisions are routed by action type and need a target."""
+        integration = PyBoyBattleIntegration(None)
+
+        self.assertTrue(integration.execute_battle_decision(
+            {"action_type": "use_item", "item": "Potion"}))
+        self.assertFalse(integration.execute_battle_decision({"action_type": "use_item"}))
+        self.assertFalse(integration.execute_battle_decision(
+            {"action_type": "run", "item": "Potion"}))
+
+    def test_create_pokemon_from_memory_data(self):
+        """Test conversion of raw memory type IDs to Pokemon objects."""
+        integration = PyBoyBattleIntegration(None)
+        data = {
+            'species': 6, 'level': 36, 'hp': 120, 'max_hp': 120,
+            'types': [0x14, 0x02],
+            'attack': 84, 'defense': 78, 'special': 85, 'speed': 100,
+            'moves': [
+                {'name': 'Move_053', 'type': 0x14, 'category': 'Special',
+                 'power': 95, 'pp': 15, 'accuracy': 100},
+                {'name': 'Move_999', 'type': 0x06, 'category': 'Physical',
+                 'power': 40, 'pp': 35, 'accuracy': 100},
+                {'name': 'Move_010', 'type': 0x00}
+            ]
+        }
+
+        pokemon = integration._create_pokemon_from_data(data)
+
+        self.assertEqual(pokemon.types, [PokemonType.FIRE, PokemonType.FLYING])
+        self.assertEqual(pokemon.moves[0].type, PokemonType.FIRE)
+        # Unknown type IDs fall back to Normal
+        self.assertEqual(pokemon.moves[1].type, PokemonType.NORMAL)
+        # Moves missing required fields are skipped
+        self.assertEqual(len(pokemon.moves), 2)
+
+    def test_cached_pokemon_reused_until_snapshot_changes(self):
+        """Test that unchanged memory snapshots reuse the converted Pokemon."""
+        integration = PyBoyBattleIntegration(None)
+        data = {
+            'species': 25, 'level': 12, 'hp': 35, 'max_hp': 35, 'types': [0x17],
+            'attack': 55, 'defense': 30, 'special': 50, 'speed': 90,
+            'moves': [{'name': 'Move_084', 'type': 0x17, 'category': 'Special',
+                       'power': 40, 'pp': 30, 'accuracy': 100}]
+        }
+
+        first = integration._get_cached_pokemon("player", data)
+        self.assertIs(integration._get_cached_pokemon("player", dict(data)), first)
+
+        data['hp'] = 20
+        changed = integration._get_cached_pokemon("player", data)
+        self.assertIsNot(changed, first)
+        self.assertEqual(changed.hp, 20)
+        # Unchanged moveset keeps the existing Move objects, in a list of its own
+        self.assertIs(changed.moves[0], first.moves[0])
+        self.assertIsNot(changed.moves, first.moves)
+
+        # A PP change alone, with HP unchanged, still rebuilds the moves
+        data['moves'] = [dict(data['moves'][0], pp=29)]
+        spent = integration._get_cached_pokemon("player", dict(data))
+        self.assertIsNot(spent, changed)
+        self.assertEqual(spent.moves[0].pp, 29)
+        self.assertIsNot(spent.moves[0], changed.moves[0])
+        self.assertIs(integration._get_cached_pokemon("player", dict(data)), spent)
+
+        # A status change rebuilds the Pokemon around the same Move objects
+        poisoned = integration._get_cached_pokemon("player", dict(data, status=0x02))
+        self.assertEqual(poisoned.status_condition, "Poison")
+        self.assertIs(poisoned.moves[0], spent.moves[0])
+
+    def test_cached_party_rebuilds_only_changed_members(self):
+        """Test that a party change only rebuilds the members that changed."""
+        integration = PyBoyBattleIntegration(None)
+        move = {'name': 'Move_033', 'type': 0x00, 'category': 'Physical',
+                'power': 35, 'pp': 35, 'accuracy': 100}
+        party_info = [
+            {'species': 1, 'level': 5, 'hp': 20, 'max_hp': 20, 'types': [0x16, 0x03],
+             'attack': 10, 'defense': 10, 'special': 12, 'speed': 9, 'moves': [move]},
+            {'species': 4, 'level': 5, 'hp': 19, 'max_hp': 19, 'types': [0x14],
+             'attack': 11, 'defense': 9, 'special': 10, 'speed': 12, 'moves': [move]},
+        ]
+        first = integration._get_cached_party(party_info)
+
+        party_info[1] = dict(party_info[1], hp=7)
+        second = integration._get_cached_party(party_info)
+
+        self.assertIs(second[0], first[0])
+        self.assertIsNot(second[1], first[1])
+        self.assertEqual(second[1].hp, 7)
+        self.assertIs(second[1].moves[0], first[1].moves[0])
+
+    def test_cached_party_refreshed_on_bench_pp_and_status(self):
+        """Test that bench PP or status changes with unchanged HP rebuild that member."""
+        integration = PyBoyBattleIntegration(None)
+        move = {'name': 'Move_033', 'type': 0x00, 'category': 'Physical',
+                'power': 35, 'pp': 1, 'accuracy': 100}
+        party_info = [
+            {'species': 1, 'level': 5, 'hp': 20, 'max_hp': 20, 'status': 0, 'types': [0x16, 0x03],
+             'attack': 10, 'defense': 10, 'special': 12, 'speed': 9, 'moves': [move]},
+            {'species': 4, 'level': 5, 'hp': 19, 'max_hp': 19, 'status': 0, 'types': [0x14],
+             'attack': 11, 'defense': 9, 'special': 10, 'speed': 12, 'moves': [move]},
+        ]
+        first = integration._get_cached_party(party_info)
+
+        party_info[1] = dict(party_info[1], moves=[dict(move, pp=0)])
+        spent = integration._get_cached_party(party_info)
+        self.assertIs(spent[0], first[0])
+        self.assertEqual(spent[1].moves[0].pp, 0)
+        self.assertEqual(spent[1].get_available_moves(), [])
+
+        party_info[0] = dict(party_info[0], status=0x01)
+        asleep = integration._get_cached_party(party_info)
+        self.assertIs(asleep[1], spent[1])
+        self.assertEqual(asleep[0].status_condition, "Sleep")
+
 
 class TestEdgeCases(unittest.TestCase):
     """Test edge cases and error conditions."""
@@ -0,0 +1,185 @@
+"""
+Tests for the grid Pathfinder.
+Tests neighbour expansion, terrain costs and the BFS, Dijkstra and A* searches.
+"""
+
+import unittest
+from unittest.mock import patch
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+import tools.pathfinder as pathfinder_module
+from tools.pathfinder import Pathfinder
+
+
+def _walk(start, path):
+    """Follow a list of directions from start and return the end position."""
+    steps = {'UP': (-1, 0), 'DOWN': (1, 0), 'LEFT': (0, -1), 'RIGHT': (0, 1)}
+    x, y = start
+    for direction in path:
+        dx, dy = steps[direction]
+        x, y = x + dx, y + dy
+    return x, y
+
+
+class TestNeighbors(unittest.TestCase):
+    """Test neighbour expansion on the padded grid."""
+
+    def setUp(self):
+        self.pathfinder = Pathfinder([
+            [0, 0, 0],
+            [0, 1, 3],
+            [0, 0, 0]
+        ])
+
+    def test_corner_neighbors(self):
+        """Test that cells outside the grid are never returned."""
+        neighbors = self.pathfinder.get_neighbors((0, 0))
+
+        self.assertEqual(neighbors, [((1, 0), 'DOWN', 1), ((0, 1), 'RIGHT', 1)])
+
+    def test_obstacles_and_terrain_cost(self):
+        """Test that obstacles are skipped and terrain values are used as costs."""
+        neighbors = self.pathfinder.get_neighbors((0, 2))
+
+        self.assertEqual(neighbors, [((1, 2), 'DOWN', 3), ((0, 1), 'LEFT', 1)])
+
+    def test_empty_grid(self):
+        """Test that an empty grid can be constructed."""
+        pathfinder = Pathfinder([])
+
+        self.assertEqual((pathfinder.rows, pathfinder.cols), (0, 0))
+
+
+class TestSearch(unittest.TestCase):
+    """Test the search algorithms."""
+
+    def setUp(self):
+        self.grid = [
+            [0, 0, 0, 0],
+            [1, 1, 0, 1],
+            [0, 0, 0, 0],
+            [0, 1, 1, 0]
+        ]
+        self.pathfinder = Pathfinder(self.grid)
+
+    def test_bfs_shortest_path(self):
+        """Test that BFS finds a shortest path around obstacles."""
+        path = self.pathfinder.bfs((0, 0), (3, 0))
+
+        self.assertEqual(len(path), 7)
+        self.assertEqual(_walk((0, 0), path), (3, 0))
+
+    def test_bfs_meets_in_the_middle(self):
+        """Test that the two BFS halves join into one shortest path, even from a blocked start."""
+        pathfinder = Pathfinder([
+            [1, 0, 0, 0, 0, 0],
+            [0, 1, 1, 1, 1, 0],
+            [0, 0, 0, 0, 1, 0],
+            [1, 1, 1, 0, 0, 0]
+        ])
+
+        path = pathfinder.bfs((0, 0), (3, 3))
+
+        self.assertEqual(len(path), 6)
+        self.assertEqual(_walk((0, 0), path), (3, 3))
+        self.assertEqual(pathfinder.bfs((2, 2), (2, 2)), [])
+        self.assertIsNone(pathfinder.bfs((2, 0), (0, 0)))
+
+    def test_dijkstra_avoids_expensive_terrain(self):
+        """Test that Dijkstra prefers a longer route over costly terrain."""
+        pathfinder = Pathfinder([
+            [0, 9, 0],
+            [0, 0, 0]
+        ])
+
+        path = pathfinder.dijkstra((0, 0), (0, 2))
+
+        self.assertEqual(path, ['DOWN', 'RIGHT', 'RIGHT', 'UP'])
+
+    def test_astar_shortest_path(self):
+        """Test that A* finds a shortest path around obstacles."""
+        path = self.pathfinder.astar((0, 0), (3, 3))
+
+        self.assertEqual(len(path), 6)
+        self.assertEqual(_walk((0, 0), path), (3, 3))
+
+    def test_astar_python_fallback_matches(self):
+        """Test that the pure-Python A* agrees with the compiled kernel."""
+        pathfinder = Pathfinder([
+            [0, 9, 0, 0],
+            [0, 0, 2, 0],
+            [1, 0, 1, 0]
+        ])
+        compiled = pathfinder.astar((0, 0), (2, 3))
+
+        with patch.object(pathfinder_module, 'NUMBA_AVAILABLE', False):
+            fallback = pathfinder.astar((0, 0), (2, 3))
+
+        self.assertEqual(compiled, fallback)
+        self.assertEqual(_walk((0, 0), fallback), (2, 3))
+
+    def test_astar_reuses_search_buffers(self):
+        """Test that back-to-back searches on one grid match searches on fresh pathfinders."""
+        queries = [((0, 0), (3, 3)), ((3, 0), (0, 3)), ((0, 0), (3, 0)), ((2, 3), (0, 0))]
+
+        paths = [self.pathfinder.astar(start, goal) for start, goal in queries]
+
+        self.assertEqual(paths, [Pathfinder(self.grid).astar(start, goal) for start, goal in queries])
+
+    def test_numpy_grid(self):
+        """Test that an int16 array grid searches exactly like the equivalent lists."""
+        pathfinder = Pathfinder(np.array(self.grid, dtype=np.int16))
+
+        self.assertEqual(pathfinder.astar((0, 0), (3, 3)), self.pathfinder.astar((0, 0), (3, 3)))
+        self.assertEqual(pathfinder.bfs((0, 0), (3, 0)), self.pathfinder.bfs((0, 0), (3, 0)))
+
+    def test_costs_above_127(self):
+        """Test that terrain costs beyond one signed byte are kept as given."""
+        pathfinder = Pathfinder([
+            [0, 200, 0],
+            [0, 150, 0],
+            [0, 0, 0]
+        ])
+
+        self.assertEqual(pathfinder.get_neighbors((0, 0)), [((1, 0), 'DOWN', 1), ((0, 1), 'RIGHT', 200)])
+        expected = ['DOWN', 'DOWN', 'RIGHT', 'RIGHT', 'UP', 'UP']
+        self.assertEqual(pathfinder.dijkstra((0, 0), (0, 2)), expected)
+        self.assertEqual(pathfinder.astar((0, 0), (0, 2)), expected)
+        with patch.object(pathfinder_module, 'NUMBA_AVAILABLE', False):
+            self.assertEqual(pathfinder.astar((0, 0), (0, 2)), expected)
+
+    def test_invalid_costs_rejected(self):
+        """Test that fractional, negative and oversized costs raise instead of being truncated."""
+        for grid in ([[0, 1.5, 0]], [[0, -2, 0]], [[0, 40000, 0]]):
+            with self.assertRaises(ValueError):
+                Pathfinder(grid)
+
+        # Whole-number floats are plain costs
+        self.assertEqual(Pathfinder([[0, 2.0, 0]]).astar((0, 0), (0, 2)), ['RIGHT', 'RIGHT'])
+
+    def test_astar_edge_cases(self):
+        """Test A* on identical, out-of-bounds and blocked endpoints."""
+        self.assertEqual(self.pathfinder.astar((2, 2), (2, 2)), [])
+        self.assertIsNone(self.pathfinder.astar((0, 0), (4, 0)))
+        self.assertIsNone(self.pathfinder.astar((1, 0), (0, 0)))
+
+    def test_unreachable_goal(self):
+        """Test that searches report an unreachable goal with None."""
+        pathfinder = Pathfinder([
+            [0, 1, 0],
+            [0, 1, 0]
+        ])
+
+        self.assertIsNone(pathfinder.bfs((0, 0), (0, 2)))
+        self.assertIsNone(pathfinder.dijkstra((0, 0), (0, 2)))
+        self.assertIsNone(pathfinder.astar((0, 0), (0, 2)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,5 @@
 import unittest
-from memory_map.pokemon_memory_map import PokemonMemoryMap
+from memory_map.pokemon_memory_map import PokemonMemoryMap, get_player_coordinates, get_block_coordinates
 
 class TestPokemonMemoryMap(unittest.TestCase):
     def setUp(self):
@@ -39,6 +39,10 @@ class TestPokemonMemoryMap(unittest.TestCase):
     def test_get_block_coordinates(self):
         self.assertEqual(self.memory_map.get_block_coordinates(self.memory), (0x01, 0x02))
 
+    def test_coordinate_convenience_functions(self):
+        self.assertEqual(get_player_coordinates(self.memory), (0x0F, 0x14))
+        self.assertEqual(get_block_coordinates(self.memory), (0x01, 0x02))
+
     def test_is_in_battle(self):
         self.assertTrue(self.memory_map.is_in_battle(self.memory))
 
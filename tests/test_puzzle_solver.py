@@ -0,0 +1,91 @@
+"""
+Tests for the PuzzleSolver.
+Tests the boulder puzzle search on small Strength-style layouts.
+"""
+
+import unittest
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.puzzle_solver import (
+    PuzzleSolver, FLOOR, WALL, BOULDER, TARGET, PLAYER, BOULDER_ON_TARGET
+)
+
+_STEPS = {'UP': (-1, 0), 'DOWN': (1, 0), 'LEFT': (0, -1), 'RIGHT': (0, 1)}
+
+
+def _play(grid, moves):
+    """Apply moves to a grid and return the final boulder positions."""
+    boulders = {(x, y) for x, row in enumerate(grid) for y, cell in enumerate(row)
+                if cell in (BOULDER, BOULDER_ON_TARGET)}
+    player = next((x, y) for x, row in enumerate(grid) for y, cell in enumerate(row) if cell == PLAYER)
+    for move in moves:
+        dx, dy = _STEPS[move]
+        nxt = (player[0] + dx, player[1] + dy)
+        assert grid[nxt[0]][nxt[1]] != WALL
+        if nxt in boulders:
+            beyond = (nxt[0] + dx, nxt[1] + dy)
+            assert grid[beyond[0]][beyond[1]] != WALL and beyond not in boulders
+            boulders = (boulders - {nxt}) | {beyond}
+        player = nxt
+    return boulders
+
+
+class TestBoulderPuzzle(unittest.TestCase):
+    """Test the boulder puzzle solver."""
+
+    def setUp(self):
+        self.solver = PuzzleSolver()
+
+    def test_single_push(self):
+        """Test pushing one boulder straight onto a switch."""
+        grid = [
+            [WALL, WALL, WALL, WALL, WALL],
+            [WALL, PLAYER, BOULDER, TARGET, WALL],
+            [WALL, WALL, WALL, WALL, WALL]
+        ]
+
+        self.assertEqual(self.solver.solve_boulder_puzzle(grid), ['RIGHT'])
+
+    def test_walk_around_then_push(self):
+        """Test that the player walks behind a boulder before pushing it."""
+        grid = [
+            [WALL, WALL, WALL, WALL, WALL],
+            [WALL, FLOOR, FLOOR, FLOOR, WALL],
+            [WALL, FLOOR, BOULDER, FLOOR, WALL],
+            [WALL, FLOOR, TARGET, PLAYER, WALL],
+            [WALL, WALL, WALL, WALL, WALL]
+        ]
+
+        moves = self.solver.solve_boulder_puzzle(grid)
+
+        self.assertEqual(moves, ['UP', 'UP', 'LEFT', 'DOWN'])
+        self.assertEqual(_play(grid, moves), {(3, 2)})
+
+    def test_already_solved_and_unsolvable(self):
+        """Test solved layouts, boulders stuck in corners and missing players."""
+        solved = [[PLAYER, BOULDER_ON_TARGET]]
+        stuck = [
+            [WALL, WALL, WALL, WALL],
+            [WALL, BOULDER, PLAYER, WALL],
+            [WALL, FLOOR, TARGET, WALL],
+            [WALL, WALL, WALL, WALL]
+        ]
+
+        self.assertEqual(self.solver.solve_boulder_puzzle(solved), [])
+        self.assertIsNone(self.solver.solve_boulder_puzzle(stuck))
+        self.assertIsNone(self.solver.solve_boulder_puzzle([[BOULDER, TARGET]]))
+
+    def test_generic_dispatch(self):
+        """Test that the generic entry point forwards keyword arguments."""
+        grid = [[PLAYER, BOULDER, FLOOR, TARGET]]
+
+        self.assertEqual(self.solver.solve_generic_puzzle('Boulder', grid, max_states=100),
+                         ['RIGHT', 'RIGHT'])
+
+
+if __name__ == '__main__':
+    unittest.main()
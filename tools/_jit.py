@@ -0,0 +1,17 @@
+"""
+Optional Numba support for the tools package.
+Numeric kernels are decorated with ``njit`` from here; when Numba is not installed
+the decorator is a no-op and the kernels run as plain Python over NumPy arrays.
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit supporting both ``@njit`` and ``@njit(...)``."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
@@ -1,33 +1,175 @@
 from collections import deque
 import heapq
-from typing import List, Tuple, Optional
-
-
-class Node:
-    """A node class for A* pathfinding with f, g, h values."""
-
-    def __init__(self, position: Tuple[int, int], g: float = 0, h: float = 0):
-        self.position = position
-        self.g = g  # Cost from start to this node
-        self.h = h  # Heuristic cost from this node to goal
-        self.f = g + h  # Total cost
-
-    def __lt__(self, other):
-        return self.f < other.f
+from itertools import count
+from typing import List, Tuple, Optional, Union
+
+import numpy as np
+
+from tools._jit import njit, NUMBA_AVAILABLE
+
+# (direction, dx, dy) for the four moves, in neighbour expansion order
+_DIRS = (('UP', -1, 0), ('DOWN', 1, 0), ('LEFT', 0, -1), ('RIGHT', 0, 1))
+_DIR_NAMES = tuple(d[0] for d in _DIRS)
+_OPPOSITE = {'UP': 'DOWN', 'DOWN': 'UP', 'LEFT': 'RIGHT', 'RIGHT': 'LEFT'}
+_DX = np.array([d[1] for d in _DIRS], dtype=np.intp)
+_DY = np.array([d[2] for d in _DIRS], dtype=np.intp)
+# Cell type of the padded grid; it bounds the largest terrain cost
+_CELL_DTYPE = np.int16
+_MAX_COST = np.iinfo(_CELL_DTYPE).max
+
+
+@njit(cache=True)
+def _astar_kernel(passable, cost, width, start, goal, g, came_dir, closed, heap_keys, heap_vals):
+    """
+    A* over the flattened padded grid.
+
+    Cells are flat indices x * width + y; the blocked border means the four
+    neighbours are always at -width, +width, -1 and +1. The open set is a binary
+    heap over int64 keys packing (f << 32) | push counter, so equal f values pop
+    in push order. The work arrays come from _alloc_astar_buffers and are reset
+    here, so repeated searches on one grid allocate nothing. Returns (found,
+    direction codes into _DIRS).
+    """
+    offsets = np.array([-width, width, -1, 1], dtype=np.int64)
+    inf = np.int64(1) << 62
+    g.fill(inf)
+    closed.fill(False)
+    # came_dir needs no reset: only cells reached in this search are read back
+    gx = goal // width
+    gy = goal % width
+
+    g[start] = 0
+    heap_keys[0] = (abs(start // width - gx) + abs(start % width - gy)) << 32
+    heap_vals[0] = start
+    size = 1
+    counter = 1
+
+    found = False
+    while size > 0:
+        current = heap_vals[0]
+        # Pop the root and sift the last entry down
+        size -= 1
+        key = heap_keys[size]
+        val = heap_vals[size]
+        i = 0
+        while True:
+            child = 2 * i + 1
+            if child >= size:
+                break
+            if child + 1 < size and heap_keys[child + 1] < heap_keys[child]:
+                child += 1
+            if heap_keys[child] >= key:
+                break
+            heap_keys[i] = heap_keys[child]
+            heap_vals[i] = heap_vals[child]
+            i = child
+        if size > 0:
+            heap_keys[i] = key
+            heap_vals[i] = val
+
+        if closed[current]:
+            continue
+        closed[current] = True
+        if current == goal:
+            found = True
+            break
+
+        for d in range(4):
+            neighbor = current + offsets[d]
+            if not passable[neighbor]:
+                continue
+            new_cost = g[current] + cost[neighbor]
+            if new_cost < g[neighbor]:
+                g[neighbor] = new_cost
+                came_dir[neighbor] = d
+                h = abs(neighbor // width - gx) + abs(neighbor % width - gy)
+                key = ((new_cost + h) << 32) | counter
+                counter += 1
+                # Push and sift up
+                i = size
+                size += 1
+                while i > 0:
+                    parent = (i - 1) // 2
+                    if heap_keys[parent] <= key:
+                        break
+                    heap_keys[i] = heap_keys[parent]
+                    heap_vals[i] = heap_vals[parent]
+                    i = parent
+                heap_keys[i] = key
+                heap_vals[i] = neighbor
+
+    if not found:
+        return False, np.empty(0, dtype=np.int8)
+
+    length = 0
+    current = goal
+    while current != start:
+        current -= offsets[came_dir[current]]
+        length += 1
+    path = np.empty(length, dtype=np.int8)
+    current = goal
+    for i in range(length - 1, -1, -1):
+        d = came_dir[current]
+        path[i] = d
+        current -= offsets[d]
+    return True, path
+
+
+def _alloc_astar_buffers(n):
+    """Work arrays for _astar_kernel over n flat cells: g, came_dir, closed, heap keys and values."""
+    # Every relaxation pushes at most once per edge, so 4n + 1 heap entries always suffice
+    return (np.empty(n, dtype=np.int64), np.empty(n, dtype=np.int8), np.empty(n, dtype=np.bool_),
+            np.empty(4 * n + 1, dtype=np.int64), np.empty(4 * n + 1, dtype=np.int64))
 
 
 class Pathfinder:
-    def __init__(self, grid: List[List[int]]):
+    def __init__(self, grid: Union[List[List[int]], np.ndarray]):
         """
         Initialize the Pathfinder with a 2D grid.
 
         Args:
-            grid: 2D list representing the grid where 0 is passable, 1 is obstacle
+            grid: 2D list or integer array representing the grid where 0 is passable,
+                1 is obstacle and larger values are passable terrain with that movement
+                cost. An int16 array is copied into the padded grid without any
+                per-cell conversion
+
+        Raises:
+            ValueError: If a cell is not a whole number between 0 and 32767
         """
         self.grid = grid
         self.rows = len(grid)
         self.cols = len(grid[0]) if self.rows > 0 else 0
 
+        # int16 copy padded with a blocked border, so a neighbour probe at (x + 1, y + 1)
+        # never needs a bounds check
+        self._g = np.ones((self.rows + 2, self.cols + 2), dtype=_CELL_DTYPE)
+        if self.rows and self.cols:
+            cells = np.asarray(grid)
+            if cells.dtype != _CELL_DTYPE:
+                # Searches add integer step costs, so fractional or out-of-range
+                # cells are rejected rather than truncated or wrapped
+                if (cells.dtype.kind not in 'biuf' or not np.all(np.isfinite(cells))
+                        or np.any(cells != np.floor(cells))):
+                    raise ValueError("grid cells must be whole-number terrain costs")
+                if cells.size and (cells.min() < 0 or cells.max() > _MAX_COST):
+                    raise ValueError(f"grid cells must be between 0 and {_MAX_COST}")
+            self._g[1:-1, 1:-1] = cells
+        self._passable = self._g != 1
+        # Cost of stepping into each cell; plain passable cells (0) cost 1
+        self._cost = np.maximum(self._g, 1)
+        # Flat views for the compiled A* kernel
+        self._passable_flat = self._passable.ravel()
+        self._cost_flat = self._cost.ravel()
+        # Padded step costs flattened to one int per cell for the Python search
+        # loops (cell (x, y) at (x + 1) * stride + y + 1), with 0 marking blocked
+        # cells so one lookup answers both questions
+        self._stride = self.cols + 2
+        self._flat = np.where(self._passable, self._cost, 0).ravel().tolist()
+        # (direction, dx, dy, flat offset) for each move
+        self._steps = tuple((direction, dx, dy, dx * self._stride + dy) for direction, dx, dy in _DIRS)
+        # Compiled A* work arrays, allocated by the first search and reused after
+        self._astar_buffers = None
+
     def get_neighbors(self, node: Tuple[int, int]) -> List[Tuple[Tuple[int, int], str, int]]:
         """
         Returns list of valid neighboring nodes with their movement cost.
@@ -39,16 +181,13 @@ class Pathfinder:
             List of tuples containing (position, direction, cost)
         """
         x, y = node
-        neighbors = []
-        directions = [('UP', (x-1, y)), ('DOWN', (x+1, y)),
-                     ('LEFT', (x, y-1)), ('RIGHT', (x, y+1))]
-
-        for direction, (nx, ny) in directions:
-            if 0 <= nx < self.rows and 0 <= ny < self.cols and self.grid[nx][ny] != 1:
-                # Use terrain cost if available, otherwise default to 1
-                cost = self.grid[nx][ny] if isinstance(self.grid[nx][ny], (int, float)) else 1
-                neighbors.append(((nx, ny), direction, cost))
-        return neighbors
+        # Padded coordinates of the four neighbours, probed with one fancy-index each
+        px = _DX + (x + 1)
+        py = _DY + (y + 1)
+        passable = self._passable[px, py].tolist()
+        costs = self._cost[px, py].tolist()
+        return [((x + dx, y + dy), direction, cost)
+                for (direction, dx, dy), ok, cost in zip(_DIRS, passable, costs) if ok]
 
     def _heuristic(self, a: Tuple[int, int], b: Tuple[int, int]) -> int:
         """
@@ -99,34 +238,66 @@ class Pathfinder:
             return None
 
         # Edge case: Start position is blocked
-        if self.grid[start[0]][start[1]] == 1:
+        if not self._passable[start[0] + 1, start[1] + 1]:
             return None
 
-        frontier = []
-        start_node = Node(start, g=0, h=self._heuristic(start, goal))
-        heapq.heappush(frontier, (start_node.f, start_node))
+        if NUMBA_AVAILABLE:
+            if self._astar_buffers is None:
+                self._astar_buffers = _alloc_astar_buffers(self._passable_flat.shape[0])
+            width = self.cols + 2
+            found, directions = _astar_kernel(
+                self._passable_flat, self._cost_flat, width,
+                (start[0] + 1) * width + start[1] + 1, (goal[0] + 1) * width + goal[1] + 1,
+                *self._astar_buffers
+            )
+            return [_DIR_NAMES[d] for d in directions] if found else None
+
+        # Pure-Python search, used when Numba is not installed.
+        # Heap entries are (f, push counter, position): the counter breaks f
+        # ties in push order, matching the compiled kernel
+        flat = self._flat
+        stride = self._stride
+        steps = self._steps
+        gx, gy = goal
+        push = heapq.heappush
+        pop = heapq.heappop
+        tiebreak = count()
+        frontier = [(self._heuristic(start, goal), next(tiebreak), start)]
 
         came_from = {start: None}
         cost_so_far = {start: 0}
+        # Positions already expanded; later heap entries for them are stale
+        closed = set()
 
         while frontier:
-            current_f, current_node = heapq.heappop(frontier)
-            current = current_node.position
+            _, _, current = pop(frontier)
+            if current in closed:
+                continue
+            closed.add(current)
 
             # Goal reached
             if current == goal:
                 return self._reconstruct_path(came_from, current)
 
-            # Explore neighbors
-            for neighbor, direction, cost in self.get_neighbors(current):
-                new_cost = cost_so_far[current] + cost
+            # Explore neighbors (padded lookups need no bounds checks)
+            current_cost = cost_so_far[current]
+            x, y = current
+            base = (x + 1) * stride + y + 1
+            for direction, dx, dy, offset in steps:
+                cost = flat[base + offset]
+                if not cost:
+                    continue
+                nx = x + dx
+                ny = y + dy
+                neighbor = (nx, ny)
+                new_cost = current_cost + cost
 
                 if neighbor not in cost_so_far or new_cost < cost_so_far[neighbor]:
                     cost_so_far[neighbor] = new_cost
-                    priority = new_cost + self._heuristic(neighbor, goal)
-                    neighbor_node = Node(neighbor, g=new_cost, h=self._heuristic(neighbor, goal))
-
-                    heapq.heappush(frontier, (priority, neighbor_node))
+                    # Manhattan distance to the goal, inlined
+                    priority = (new_cost + (nx - gx if nx >= gx else gx - nx)
+                                + (ny - gy if ny >= gy else gy - ny))
+                    push(frontier, (priority, next(tiebreak), neighbor))
                     came_from[neighbor] = (current, direction)
 
         return None  # No path found
@@ -156,50 +327,140 @@ class Pathfinder:
             List of direction strings representing the path
         """
         path = []
-        while current is not None:
+        # The start position maps to None
+        while came_from[current] is not None:
             current, direction = came_from[current]
-            if direction is not None:
-                path.append(direction)
+            path.append(direction)
 
         path.reverse()
         return path
 
     def bfs(self, start, goal):
-        """Breadth-First Search algorithm for pathfinding."""
-        frontier = deque([(start, [])])
-        came_from = {start: None}
+        """
+        Bidirectional Breadth-First Search for pathfinding.
 
-        while frontier:
-            current, path = frontier.popleft()
+        Searches forward from start and backward from goal, always expanding
+        one whole layer of the smaller frontier, so each side only covers about
+        half the path length. Grid moves are reversible, so the backward half
+        of the path is the backward search's directions inverted.
+        """
+        if not self._is_valid_position(start) or not self._is_valid_position(goal):
+            return None
+        if start == goal:
+            return []
 
-            if current == goal:
+        flat = self._flat
+        stride = self._stride
+        steps = self._steps
+        if not flat[(goal[0] + 1) * stride + goal[1] + 1]:
+            return None  # Goal is blocked
+
+        # came_from maps a position to (parent, direction) walking away from
+        # that side's root; depth is its distance from the root
+        came_fwd = {start: None}
+        came_bwd = {goal: None}
+        depth_fwd = {start: 0}
+        depth_bwd = {goal: 0}
+        frontier_fwd = [start]
+        frontier_bwd = [goal]
+
+        # Ties pick the forward side, so the (possibly blocked) start is only
+        # ever left, never entered, by the backward search
+        while frontier_fwd and frontier_bwd:
+            forward = len(frontier_fwd) <= len(frontier_bwd)
+            if forward:
+                frontier, came, depth, other_depth = frontier_fwd, came_fwd, depth_fwd, depth_bwd
+            else:
+                frontier, came, depth, other_depth = frontier_bwd, came_bwd, depth_bwd, depth_fwd
+
+            best = None
+            next_frontier = []
+            append = next_frontier.append
+            for current in frontier:
+                x, y = current
+                base = (x + 1) * stride + y + 1
+                d = depth[current] + 1
+                for direction, dx, dy, offset in steps:
+                    if not flat[base + offset]:
+                        continue
+                    neighbor = (x + dx, y + dy)
+                    if neighbor in other_depth:
+                        # The layer is finished before stopping, because a later
+                        # meeting point in it can still give a shorter path
+                        total = d + other_depth[neighbor]
+                        if best is None or total < best[0]:
+                            best = (total, current, direction, neighbor)
+                    elif neighbor not in came:
+                        came[neighbor] = (current, direction)
+                        depth[neighbor] = d
+                        append(neighbor)
+
+            if best is not None:
+                _, current, direction, neighbor = best
+                if forward:
+                    meet_fwd, step, meet_bwd = current, direction, neighbor
+                else:
+                    meet_fwd, step, meet_bwd = neighbor, _OPPOSITE[direction], current
+                path = self._reconstruct_path(came_fwd, meet_fwd)
+                path.append(step)
+                while came_bwd[meet_bwd] is not None:
+                    meet_bwd, direction = came_bwd[meet_bwd]
+                    path.append(_OPPOSITE[direction])
                 return path
 
-            for neighbor, direction, _ in self.get_neighbors(current):
-                if neighbor not in came_from:
-                    frontier.append((neighbor, path + [direction]))
-                    came_from[neighbor] = current
+            if forward:
+                frontier_fwd = next_frontier
+            else:
+                frontier_bwd = next_frontier
 
         return None  # No path found
 
     def dijkstra(self, start, goal):
         """Dijkstra's algorithm for pathfinding with weighted edges."""
-        frontier = []
-        heapq.heappush(frontier, (0, start, []))
+        if not self._is_valid_position(start):
+            return None
+
+        flat = self._flat
+        stride = self._stride
+        steps = self._steps
+        # Dial's bucket queue: step costs are small integers, so every queued
+        # position lies within max_cost of the current distance and a ring of
+        # max_cost + 1 FIFO buckets replaces the binary heap
+        n_buckets = int(self._cost.max()) + 1
+        buckets = [deque() for _ in range(n_buckets)]
+        buckets[0].append(start)
+        pending = 1
+        current_cost = 0
         came_from = {start: None}
         cost_so_far = {start: 0}
 
-        while frontier:
-            current_cost, current, path = heapq.heappop(frontier)
+        while pending:
+            bucket = buckets[current_cost % n_buckets]
+            while not bucket:
+                current_cost += 1
+                bucket = buckets[current_cost % n_buckets]
+            current = bucket.popleft()
+            pending -= 1
+
+            # Skip entries superseded by a cheaper push
+            if cost_so_far[current] < current_cost:
+                continue
 
             if current == goal:
-                return path
+                return self._reconstruct_path(came_from, current)
 
-            for neighbor, direction, cost in self.get_neighbors(current):
-                new_cost = cost_so_far[current] + cost
+            x, y = current
+            base = (x + 1) * stride + y + 1
+            for direction, dx, dy, offset in steps:
+                cost = flat[base + offset]
+                if not cost:
+                    continue
+                neighbor = (x + dx, y + dy)
+                new_cost = current_cost + cost
                 if neighbor not in cost_so_far or new_cost < cost_so_far[neighbor]:
                     cost_so_far[neighbor] = new_cost
-                    heapq.heappush(frontier, (new_cost, neighbor, path + [direction]))
-                    came_from[neighbor] = current
+                    buckets[new_cost % n_buckets].append(neighbor)
+                    pending += 1
+                    came_from[neighbor] = (current, direction)
 
         return None  # No path found
\ No newline at end of file
@@ -1,3 +1,17 @@
+from collections import deque
+
+# Cell codes used in boulder puzzle grids
+FLOOR = 0
+WALL = 1
+BOULDER = 2
+TARGET = 3  # Switch or hole a boulder has to end up on
+PLAYER = 4
+BOULDER_ON_TARGET = 5
+
+# (direction, dx, dy) for the four moves, in the order they are tried
+_MOVES = (('UP', -1, 0), ('DOWN', 1, 0), ('LEFT', 0, -1), ('RIGHT', 0, 1))
+
+
 class PuzzleSolver:
     """
     Provides puzzle solving capabilities for Pokémon Blue,
@@ -8,18 +22,93 @@ class PuzzleSolver:
         """Initialize the PuzzleSolver."""
         pass
 
-    def solve_boulder_puzzle(self, grid):
+    def solve_boulder_puzzle(self, grid, max_states=200000):
         """
         Solves a boulder puzzle in Pokémon Blue.
 
+        Breadth-first search over (player cell, boulder layout) states, so the
+        returned moves are the fewest player steps. Each boulder layout is packed
+        into one int with a bit per grid cell, which keeps state hashing and the
+        visited set cheap.
+
         Args:
-            grid: 2D list representing the puzzle grid
+            grid: 2D list representing the puzzle grid using the cell codes
+                above (FLOOR, WALL, BOULDER, TARGET, PLAYER, BOULDER_ON_TARGET)
+            max_states: Give up after visiting this many states
 
         Returns:
-            List of moves to solve the puzzle
+            List of moves to solve the puzzle ('UP', 'DOWN', 'LEFT', 'RIGHT'),
+            or None if it cannot be solved
         """
-        # TODO: Implement boulder puzzle solver
-        return []
+        rows = len(grid)
+        cols = len(grid[0]) if rows else 0
+
+        walls = boulders = targets = 0
+        player = -1
+        for x, row in enumerate(grid):
+            for y, cell in enumerate(row):
+                bit = 1 << (x * cols + y)
+                if cell == WALL:
+                    walls |= bit
+                elif cell == BOULDER or cell == BOULDER_ON_TARGET:
+                    boulders |= bit
+                elif cell == PLAYER:
+                    player = x * cols + y
+                if cell == TARGET or cell == BOULDER_ON_TARGET:
+                    targets |= bit
+
+        if player < 0:
+            return None
+        if boulders & targets == targets:
+            return []
+
+        # Neighbouring cell index in each direction, or -1 off the grid
+        neighbors = [
+            tuple((x + dx) * cols + (y + dy) if 0 <= x + dx < rows and 0 <= y + dy < cols else -1
+                  for _, dx, dy in _MOVES)
+            for x in range(rows) for y in range(cols)
+        ]
+        directions = [name for name, _, _ in _MOVES]
+
+        start = (player, boulders)
+        came_from = {start: None}
+        frontier = deque([start])
+
+        while frontier:
+            state = frontier.popleft()
+            position, layout = state
+            for d, step in enumerate(neighbors[position]):
+                if step < 0 or walls >> step & 1:
+                    continue
+                new_layout = layout
+                if layout >> step & 1:
+                    # Push the boulder one cell further, if that cell is free
+                    beyond = neighbors[step][d]
+                    if beyond < 0 or (walls | layout) >> beyond & 1:
+                        continue
+                    new_layout = layout ^ ((1 << step) | (1 << beyond))
+
+                new_state = (step, new_layout)
+                if new_state in came_from:
+                    continue
+                came_from[new_state] = (state, directions[d])
+
+                if new_layout & targets == targets:
+                    return self._reconstruct_moves(came_from, new_state)
+                if len(came_from) >= max_states:
+                    return None
+                frontier.append(new_state)
+
+        return None
+
+    def _reconstruct_moves(self, came_from, state):
+        """Walk the parent pointers back from a solved state and return the moves in order."""
+        moves = []
+        while came_from[state] is not None:
+            state, direction = came_from[state]
+            moves.append(direction)
+        moves.reverse()
+        return moves
 
     def solve_strength_puzzle(self, grid):
         """